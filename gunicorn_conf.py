@@ -0,0 +1,17 @@
+"""
+Gunicorn settings used by the Procfile and render.yaml.
+gevent workers let a single process keep hundreds of requests in flight while they wait on Postgres.
+"""
+import os
+
+# Makes src/app.py patch psycopg2 (through psycogreen) so its queries yield to other greenlets.
+# psycopg2 cannot COPY in that mode, so /admin/import falls back to multi-row INSERTs.
+os.environ.setdefault("GEVENT_PATCH", "1")
+
+worker_class = "gevent"
+# Every worker opens its own connection pool, so keep the count small and fixed;
+# each gevent worker already serves many requests at once
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+# src/app.py splits the database connection budget by this number
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_connections = 1000
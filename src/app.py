@@ -2,29 +2,79 @@
 This module takes care of starting the API Server, Loading the DB and Adding the endpoints
 """
 import os
-from flask import Flask, request, jsonify, url_for
+if os.getenv("GEVENT_PATCH") == "1":
+    # Must happen before anything imports socket or psycopg2
+    from gevent import monkey
+    monkey.patch_all()
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+from flask import Flask, request, jsonify, url_for, g
+from sqlalchemy import select, text
+from werkzeug.exceptions import HTTPException, InternalServerError
+from sqlalchemy.orm import joinedload, raiseload
 from flask_migrate import Migrate
 from flask_swagger import swagger
 from flask_cors import CORS
-from utils import APIException, generate_sitemap
+from flask_caching import Cache
+from utils import APIException, ORJSONProvider, generate_sitemap, insert_or_ignore, import_rows
 from admin import setup_admin
 from models import db, User, Character, Planet, FavoriteCharacter, FavoritePlanet
 
 app = Flask(__name__)
 app.url_map.strict_slashes = False
+app.json = ORJSONProvider(app)
 
 # Database configuration
 db_url = os.getenv("DATABASE_URL")
 if db_url is not None:
-    app.config['SQLALCHEMY_DATABASE_URI'] = db_url.replace("postgres://", "postgresql://")
+    # Pin the psycopg2 driver: SQLAlchemy 2.1 maps a bare postgresql:// to
+    # psycopg 3, which has no executemany_mode or copy_expert
+    db_url = db_url.replace("postgres://", "postgresql://", 1)
+    app.config['SQLALCHEMY_DATABASE_URI'] = db_url.replace("postgresql://", "postgresql+psycopg2://", 1)
+    # Each gunicorn worker gets an equal share of the connections Postgres allows,
+    # two thirds kept warm and the rest opened only under bursts
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    connections_per_worker = max(int(os.getenv("DB_MAX_CONNECTIONS", 60)) // workers, 3)
+    pool_size = connections_per_worker * 2 // 3
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        "pool_size": pool_size,
+        "max_overflow": connections_per_worker - pool_size,
+        "pool_pre_ping": True,
+        "insertmanyvalues_page_size": 1000
+    }
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith("postgresql+psycopg2://"):
+        # psycopg2 fast execution helpers: INSERTs already use multi-row VALUES,
+        # this also batches executemany UPDATE/DELETE with execute_batch()
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'].update({
+            "executemany_mode": "values_plus_batch",
+            "executemany_batch_page_size": 500
+        })
 else:
     app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:////tmp/test.db"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Cache configuration: Redis when available, no caching otherwise.
+# An in-process cache would go stale across gunicorn workers, since
+# invalidation only reaches the worker that handled the write.
+redis_url = os.getenv("REDIS_URL")
+if redis_url is not None:
+    app.config['CACHE_TYPE'] = "RedisCache"
+    app.config['CACHE_REDIS_URL'] = redis_url
+else:
+    app.config['CACHE_TYPE'] = "NullCache"
+    app.config['CACHE_NO_NULL_WARNING'] = True
+app.config['CACHE_DEFAULT_TIMEOUT'] = 60
+
+# Keyset pagination for the list endpoints
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
 # Initialize extensions
 MIGRATE = Migrate(app, db)
 db.init_app(app)
 CORS(app)
+cache = Cache(app)
 setup_admin(app)
 
 # Handle/serialize errors like a JSON object
@@ -32,6 +82,72 @@ setup_admin(app)
 def handle_invalid_usage(error):
     return jsonify(error.to_dict()), error.status_code
 
+# Any other error rolls back the request's transaction and is reported as JSON
+@app.errorhandler(Exception)
+def handle_unexpected_error(error):
+    db.session.rollback()
+    if isinstance(error, InternalServerError) and error.original_exception is not None:
+        error = error.original_exception
+    if isinstance(error, HTTPException):
+        return jsonify({"error": error.description}), error.code
+    return jsonify({"error": str(error)}), 500
+
+# Transactions are managed per request: handlers only stage changes
+@app.before_request
+def relax_write_durability():
+    # Creates can afford to lose the last few milliseconds of commits on a server crash,
+    # so don't make them wait for the WAL flush
+    if request.method == 'POST' and db.engine.dialect.name == 'postgresql':
+        db.session.execute(text("SET LOCAL synchronous_commit = off"))
+
+@app.after_request
+def commit_session(response):
+    if response.status_code >= 400:
+        db.session.rollback()
+        return response
+    db.session.commit()
+    # The write is already durable, so a failing callback (e.g. Redis down) must not turn it into an error
+    for callback, args in g.pop('after_commit', []):
+        try:
+            callback(*args)
+        except Exception:
+            app.logger.exception("after_commit callback %s failed", callback.__name__)
+    return response
+
+def after_commit(callback, *args):
+    # Defer e.g. cache invalidation until the new rows are visible to other requests
+    g.setdefault('after_commit', []).append((callback, args))
+
+def is_success(rv):
+    # Only cache successful responses; errors and 404s are always recomputed
+    return rv[1] == 200
+
+def list_cache_key(name):
+    # Every page is cached under the list's current version, so bumping it drops all pages at once
+    def make_cache_key():
+        version = cache.get(f'{name}/version') or 0
+        return f"{name}/{version}/{request.query_string.decode()}"
+    return make_cache_key
+
+def bump_list_version(name):
+    # Atomic on Redis (INCR), so concurrent writers never both land on the same new version;
+    # a missing key starts over from 1
+    cache.cache.inc(f'{name}/version')
+
+def invalidate_people_cache(people_id=None):
+    bump_list_version('all_people')
+    if people_id is not None:
+        cache.delete_memoized(get_person_response, people_id, False)
+        cache.delete_memoized(get_person_response, people_id, True)
+
+def invalidate_planets_cache(planet_id=None):
+    bump_list_version('all_planets')
+    if planet_id is not None:
+        cache.delete_memoized(get_single_planet, planet_id)
+        # Characters can embed their homeworld (?expand=homeworld), so any cached person may be stale too
+        bump_list_version('all_people')
+        cache.delete_memoized(get_person_response)
+
 # Generate sitemap with all your endpoints
 @app.route('/')
 def sitemap():
@@ -44,22 +160,18 @@ def sitemap():
 @app.route('/users', methods=['GET'])
 def get_all_users():
     """Get a list of all the blog post users"""
-    try:
-        users = User.query.all()
-        return jsonify([user.serialize() for user in users]), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    # No relationships are serialized, so select the columns directly and skip ORM hydration
+    rows = db.session.execute(select(*[getattr(User, field) for field in User.serialize_fields])).all()
+    return jsonify([dict(zip(User.serialize_fields, row)) for row in rows]), 200
 
 @app.route('/users/<int:user_id>', methods=['GET'])
+@cache.memoize(response_filter=is_success)
 def get_single_user(user_id):
     """Get one single user's information"""
-    try:
-        user = User.query.get(user_id)
-        if user is None:
-            return jsonify({"error": "User not found"}), 404
-        return jsonify(user.serialize()), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    user = db.session.get(User, user_id)
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    return jsonify(user.serialize()), 200
 
 @app.route('/users/favorites', methods=['GET'])
 def get_user_favorites():
@@ -68,65 +180,116 @@ def get_user_favorites():
     # In a real app, you'd get this from authentication/session
     current_user_id = 1
     
-    try:
-        user = User.query.get(current_user_id)
-        if user is None:
-            return jsonify({"error": "User not found"}), 404
-        
-        favorite_characters = [fav.serialize() for fav in user.favorite_characters]
-        favorite_planets = [fav.serialize() for fav in user.favorite_planets]
-        
-        return jsonify({
-            "user_id": current_user_id,
-            "username": user.username,
-            "favorite_characters": favorite_characters,
-            "favorite_planets": favorite_planets
-        }), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    username = db.session.execute(
+        select(User.username).where(User.id == current_user_id)
+    ).scalar_one_or_none()
+    if username is None:
+        return jsonify({"error": "User not found"}), 404
+    
+    # Project only the columns the response needs instead of hydrating ORM objects
+    character_rows = db.session.execute(
+        select(FavoriteCharacter.id, Character.id, Character.name, Character.image_url, FavoriteCharacter.created_at)
+        .join(Character, FavoriteCharacter.character_id == Character.id)
+        .where(FavoriteCharacter.user_id == current_user_id)
+    ).all()
+    planet_rows = db.session.execute(
+        select(FavoritePlanet.id, Planet.id, Planet.name, Planet.image_url, FavoritePlanet.created_at)
+        .join(Planet, FavoritePlanet.planet_id == Planet.id)
+        .where(FavoritePlanet.user_id == current_user_id)
+    ).all()
+    
+    favorite_characters = [{
+        "id": favorite_id,
+        "user_id": current_user_id,
+        "character_id": character_id,
+        "character": {"id": character_id, "name": name, "image_url": image_url},
+        "created_at": created_at
+    } for favorite_id, character_id, name, image_url, created_at in character_rows]
+    favorite_planets = [{
+        "id": favorite_id,
+        "user_id": current_user_id,
+        "planet_id": planet_id,
+        "planet": {"id": planet_id, "name": name, "image_url": image_url},
+        "created_at": created_at
+    } for favorite_id, planet_id, name, image_url, created_at in planet_rows]
+    
+    return jsonify({
+        "user_id": current_user_id,
+        "username": username,
+        "favorite_characters": favorite_characters,
+        "favorite_planets": favorite_planets
+    }), 200
 
 # ============================================
 # CHARACTER (PEOPLE) ENDPOINTS
 # ============================================
 
 @app.route('/people', methods=['GET'])
+@cache.cached(key_prefix=list_cache_key('all_people'), response_filter=is_success)
 def get_all_people():
-    """Get a list of all the people in the database"""
-    try:
-        characters = Character.query.all()
-        return jsonify([character.serialize() for character in characters]), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    """Get a page of the people in the database, starting after the given id"""
+    after = request.args.get('after', 0, type=int)
+    limit = request.args.get('limit', PAGE_SIZE, type=int)
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"}), 400
+    
+    expand = 'homeworld' in request.args.get('expand', '').split(',')
+    if not expand:
+        # Without the nested homeworld no relationship is serialized, so select the columns directly
+        rows = db.session.execute(
+            select(*[getattr(Character, field) for field in Character.serialize_fields])
+            .where(Character.id > after)
+            .order_by(Character.id)
+            .limit(limit)
+        ).all()
+        return jsonify({
+            "data": [dict(zip(Character.serialize_fields, row)) for row in rows],
+            "next": rows[-1].id if len(rows) == limit else None
+        }), 200
+    
+    # The homeworld is joined in; any other relationship access raises
+    characters = db.session.scalars(
+        select(Character)
+        .options(joinedload(Character.homeworld), raiseload('*'))
+        .where(Character.id > after)
+        .order_by(Character.id)
+        .limit(limit)
+    ).all()
+    return jsonify({
+        "data": [character.serialize(expand=True) for character in characters],
+        "next": characters[-1].id if len(characters) == limit else None
+    }), 200
 
 @app.route('/people/<int:people_id>', methods=['GET'])
 def get_single_person(people_id):
     """Get one single person's information"""
-    try:
-        character = Character.query.get(people_id)
-        if character is None:
-            return jsonify({"error": "Character not found"}), 404
-        return jsonify(character.serialize()), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    expand = 'homeworld' in request.args.get('expand', '').split(',')
+    return get_person_response(people_id, expand)
+
+# Memoized separately from the view so the cache key includes the expand flag
+@cache.memoize(response_filter=is_success)
+def get_person_response(people_id, expand):
+    options = [joinedload(Character.homeworld)] if expand else []
+    character = db.session.get(Character, people_id, options=options)
+    if character is None:
+        return jsonify({"error": "Character not found"}), 404
+    return jsonify(character.serialize(expand=expand)), 200
 
 @app.route('/people', methods=['POST'])
 def create_person():
     """Create a new character/person"""
-    try:
-        body = request.get_json()
-        if not body:
-            return jsonify({"error": "Request body is required"}), 400
-        
-        # Validate required fields
-        if not body.get('name'):
-            return jsonify({"error": "Name is required"}), 400
-        
-        # Check if character already exists
-        existing = Character.query.filter_by(name=body.get('name')).first()
-        if existing:
-            return jsonify({"error": "Character with this name already exists"}), 400
-        
-        character = Character(
+    body = request.get_json()
+    if not body:
+        return jsonify({"error": "Request body is required"}), 400
+    
+    # Validate required fields
+    if not body.get('name'):
+        return jsonify({"error": "Name is required"}), 400
+    
+    # The unique index on name rejects duplicates; no row comes back when it does
+    character = db.session.execute(
+        insert_or_ignore(db.session, Character, ['name'])
+        .values(
             name=body.get('name'),
             height=body.get('height'),
             mass=body.get('mass'),
@@ -139,115 +302,155 @@ def create_person():
             description=body.get('description'),
             image_url=body.get('image_url')
         )
-        
-        db.session.add(character)
-        db.session.commit()
-        
-        return jsonify(character.serialize()), 201
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+        .returning(Character)
+    ).scalar()
+    if character is None:
+        return jsonify({"error": "Character with this name already exists"}), 400
+    
+    after_commit(invalidate_people_cache)
+    
+    return jsonify(character.serialize()), 201
+
+# Columns a client may set when creating characters in bulk
+CHARACTER_FIELDS = (
+    'name',
+    'height',
+    'mass',
+    'hair_color',
+    'skin_color',
+    'eye_color',
+    'birth_year',
+    'gender',
+    'homeworld_id',
+    'description',
+    'image_url'
+)
+
+@app.route('/people/bulk', methods=['POST'])
+def create_people_bulk():
+    """Create many characters at once from a list of objects"""
+    body = request.get_json()
+    if not isinstance(body, list) or not body:
+        return jsonify({"error": "Request body must be a non-empty list"}), 400
+    
+    # Validate required fields
+    if not all(isinstance(item, dict) and item.get('name') for item in body):
+        return jsonify({"error": "Name is required for every character"}), 400
+    
+    # Same keys on every row so SQLAlchemy batches them into multi-row INSERTs
+    rows = [{field: item.get(field) for field in CHARACTER_FIELDS} for item in body]
+    ids = db.session.scalars(
+        insert_or_ignore(db.session, Character, ['name']).returning(Character.id),
+        rows,
+        execution_options={"render_nulls": True}
+    ).all()
+    after_commit(invalidate_people_cache)
+    
+    return jsonify({"created": len(ids), "ids": ids}), 201
 
 @app.route('/people/<int:people_id>', methods=['PUT'])
 def update_person(people_id):
     """Update a character/person"""
-    try:
-        character = Character.query.get(people_id)
-        if character is None:
-            return jsonify({"error": "Character not found"}), 404
-        
-        body = request.get_json()
-        if not body:
-            return jsonify({"error": "Request body is required"}), 400
-        
-        # Update fields if provided
-        if 'name' in body:
-            character.name = body['name']
-        if 'height' in body:
-            character.height = body['height']
-        if 'mass' in body:
-            character.mass = body['mass']
-        if 'hair_color' in body:
-            character.hair_color = body['hair_color']
-        if 'skin_color' in body:
-            character.skin_color = body['skin_color']
-        if 'eye_color' in body:
-            character.eye_color = body['eye_color']
-        if 'birth_year' in body:
-            character.birth_year = body['birth_year']
-        if 'gender' in body:
-            character.gender = body['gender']
-        if 'homeworld_id' in body:
-            character.homeworld_id = body['homeworld_id']
-        if 'description' in body:
-            character.description = body['description']
-        if 'image_url' in body:
-            character.image_url = body['image_url']
-        
-        db.session.commit()
-        return jsonify(character.serialize()), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    character = db.session.get(Character, people_id)
+    if character is None:
+        return jsonify({"error": "Character not found"}), 404
+    
+    body = request.get_json()
+    if not body:
+        return jsonify({"error": "Request body is required"}), 400
+    
+    # Renames must respect the unique index on name, same as creates
+    if 'name' in body and body['name'] != character.name:
+        if db.session.scalar(select(Character.id).filter_by(name=body['name'])) is not None:
+            return jsonify({"error": "Character with this name already exists"}), 400
+    
+    # Update fields if provided
+    if 'name' in body:
+        character.name = body['name']
+    if 'height' in body:
+        character.height = body['height']
+    if 'mass' in body:
+        character.mass = body['mass']
+    if 'hair_color' in body:
+        character.hair_color = body['hair_color']
+    if 'skin_color' in body:
+        character.skin_color = body['skin_color']
+    if 'eye_color' in body:
+        character.eye_color = body['eye_color']
+    if 'birth_year' in body:
+        character.birth_year = body['birth_year']
+    if 'gender' in body:
+        character.gender = body['gender']
+    if 'homeworld_id' in body:
+        character.homeworld_id = body['homeworld_id']
+    if 'description' in body:
+        character.description = body['description']
+    if 'image_url' in body:
+        character.image_url = body['image_url']
+    
+    after_commit(invalidate_people_cache, people_id)
+    return jsonify(character.serialize()), 200
 
 @app.route('/people/<int:people_id>', methods=['DELETE'])
 def delete_person(people_id):
     """Delete a character/person"""
-    try:
-        character = Character.query.get(people_id)
-        if character is None:
-            return jsonify({"error": "Character not found"}), 404
-        
-        db.session.delete(character)
-        db.session.commit()
-        
-        return jsonify({"message": f"Character {character.name} deleted successfully"}), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    character = db.session.get(Character, people_id)
+    if character is None:
+        return jsonify({"error": "Character not found"}), 404
+    
+    db.session.delete(character)
+    after_commit(invalidate_people_cache, people_id)
+    
+    return jsonify({"message": f"Character {character.name} deleted successfully"}), 200
 
 # ============================================
 # PLANET ENDPOINTS
 # ============================================
 
 @app.route('/planets', methods=['GET'])
+@cache.cached(key_prefix=list_cache_key('all_planets'), response_filter=is_success)
 def get_all_planets():
-    """Get a list of all the planets in the database"""
-    try:
-        planets = Planet.query.all()
-        return jsonify([planet.serialize() for planet in planets]), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    """Get a page of the planets in the database, starting after the given id"""
+    after = request.args.get('after', 0, type=int)
+    limit = request.args.get('limit', PAGE_SIZE, type=int)
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"}), 400
+    
+    rows = db.session.execute(
+        select(*[getattr(Planet, field) for field in Planet.serialize_fields])
+        .where(Planet.id > after)
+        .order_by(Planet.id)
+        .limit(limit)
+    ).all()
+    return jsonify({
+        "data": [dict(zip(Planet.serialize_fields, row)) for row in rows],
+        "next": rows[-1].id if len(rows) == limit else None
+    }), 200
 
 @app.route('/planets/<int:planet_id>', methods=['GET'])
+@cache.memoize(response_filter=is_success)
 def get_single_planet(planet_id):
     """Get one single planet's information"""
-    try:
-        planet = Planet.query.get(planet_id)
-        if planet is None:
-            return jsonify({"error": "Planet not found"}), 404
-        return jsonify(planet.serialize()), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    planet = db.session.get(Planet, planet_id)
+    if planet is None:
+        return jsonify({"error": "Planet not found"}), 404
+    return jsonify(planet.serialize()), 200
 
 @app.route('/planets', methods=['POST'])
 def create_planet():
     """Create a new planet"""
-    try:
-        body = request.get_json()
-        if not body:
-            return jsonify({"error": "Request body is required"}), 400
-        
-        # Validate required fields
-        if not body.get('name'):
-            return jsonify({"error": "Name is required"}), 400
-        
-        # Check if planet already exists
-        existing = Planet.query.filter_by(name=body.get('name')).first()
-        if existing:
-            return jsonify({"error": "Planet with this name already exists"}), 400
-        
-        planet = Planet(
+    body = request.get_json()
+    if not body:
+        return jsonify({"error": "Request body is required"}), 400
+    
+    # Validate required fields
+    if not body.get('name'):
+        return jsonify({"error": "Name is required"}), 400
+    
+    # The unique index on name rejects duplicates; no row comes back when it does
+    planet = db.session.execute(
+        insert_or_ignore(db.session, Planet, ['name'])
+        .values(
             name=body.get('name'),
             rotation_period=body.get('rotation_period'),
             orbital_period=body.get('orbital_period'),
@@ -260,72 +463,106 @@ def create_planet():
             description=body.get('description'),
             image_url=body.get('image_url')
         )
-        
-        db.session.add(planet)
-        db.session.commit()
-        
-        return jsonify(planet.serialize()), 201
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+        .returning(Planet)
+    ).scalar()
+    if planet is None:
+        return jsonify({"error": "Planet with this name already exists"}), 400
+    
+    after_commit(invalidate_planets_cache)
+    
+    return jsonify(planet.serialize()), 201
+
+# Columns a client may set when creating planets in bulk
+PLANET_FIELDS = (
+    'name',
+    'rotation_period',
+    'orbital_period',
+    'diameter',
+    'climate',
+    'gravity',
+    'terrain',
+    'surface_water',
+    'population',
+    'description',
+    'image_url'
+)
+
+@app.route('/planets/bulk', methods=['POST'])
+def create_planets_bulk():
+    """Create many planets at once from a list of objects"""
+    body = request.get_json()
+    if not isinstance(body, list) or not body:
+        return jsonify({"error": "Request body must be a non-empty list"}), 400
+    
+    # Validate required fields
+    if not all(isinstance(item, dict) and item.get('name') for item in body):
+        return jsonify({"error": "Name is required for every planet"}), 400
+    
+    # Same keys on every row so SQLAlchemy batches them into multi-row INSERTs
+    rows = [{field: item.get(field) for field in PLANET_FIELDS} for item in body]
+    ids = db.session.scalars(
+        insert_or_ignore(db.session, Planet, ['name']).returning(Planet.id),
+        rows,
+        execution_options={"render_nulls": True}
+    ).all()
+    after_commit(invalidate_planets_cache)
+    
+    return jsonify({"created": len(ids), "ids": ids}), 201
 
 @app.route('/planets/<int:planet_id>', methods=['PUT'])
 def update_planet(planet_id):
     """Update a planet"""
-    try:
-        planet = Planet.query.get(planet_id)
-        if planet is None:
-            return jsonify({"error": "Planet not found"}), 404
-        
-        body = request.get_json()
-        if not body:
-            return jsonify({"error": "Request body is required"}), 400
-        
-        # Update fields if provided
-        if 'name' in body:
-            planet.name = body['name']
-        if 'rotation_period' in body:
-            planet.rotation_period = body['rotation_period']
-        if 'orbital_period' in body:
-            planet.orbital_period = body['orbital_period']
-        if 'diameter' in body:
-            planet.diameter = body['diameter']
-        if 'climate' in body:
-            planet.climate = body['climate']
-        if 'gravity' in body:
-            planet.gravity = body['gravity']
-        if 'terrain' in body:
-            planet.terrain = body['terrain']
-        if 'surface_water' in body:
-            planet.surface_water = body['surface_water']
-        if 'population' in body:
-            planet.population = body['population']
-        if 'description' in body:
-            planet.description = body['description']
-        if 'image_url' in body:
-            planet.image_url = body['image_url']
-        
-        db.session.commit()
-        return jsonify(planet.serialize()), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    planet = db.session.get(Planet, planet_id)
+    if planet is None:
+        return jsonify({"error": "Planet not found"}), 404
+    
+    body = request.get_json()
+    if not body:
+        return jsonify({"error": "Request body is required"}), 400
+    
+    # Renames must respect the unique index on name, same as creates
+    if 'name' in body and body['name'] != planet.name:
+        if db.session.scalar(select(Planet.id).filter_by(name=body['name'])) is not None:
+            return jsonify({"error": "Planet with this name already exists"}), 400
+    
+    # Update fields if provided
+    if 'name' in body:
+        planet.name = body['name']
+    if 'rotation_period' in body:
+        planet.rotation_period = body['rotation_period']
+    if 'orbital_period' in body:
+        planet.orbital_period = body['orbital_period']
+    if 'diameter' in body:
+        planet.diameter = body['diameter']
+    if 'climate' in body:
+        planet.climate = body['climate']
+    if 'gravity' in body:
+        planet.gravity = body['gravity']
+    if 'terrain' in body:
+        planet.terrain = body['terrain']
+    if 'surface_water' in body:
+        planet.surface_water = body['surface_water']
+    if 'population' in body:
+        planet.population = body['population']
+    if 'description' in body:
+        planet.description = body['description']
+    if 'image_url' in body:
+        planet.image_url = body['image_url']
+    
+    after_commit(invalidate_planets_cache, planet_id)
+    return jsonify(planet.serialize()), 200
 
 @app.route('/planets/<int:planet_id>', methods=['DELETE'])
 def delete_planet(planet_id):
     """Delete a planet"""
-    try:
-        planet = Planet.query.get(planet_id)
-        if planet is None:
-            return jsonify({"error": "Planet not found"}), 404
-        
-        db.session.delete(planet)
-        db.session.commit()
-        
-        return jsonify({"message": f"Planet {planet.name} deleted successfully"}), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    planet = db.session.get(Planet, planet_id)
+    if planet is None:
+        return jsonify({"error": "Planet not found"}), 404
+    
+    db.session.delete(planet)
+    after_commit(invalidate_planets_cache, planet_id)
+    
+    return jsonify({"message": f"Planet {planet.name} deleted successfully"}), 200
 
 # ============================================
 # FAVORITE ENDPOINTS
@@ -337,35 +574,26 @@ def add_favorite_planet(planet_id):
     # For demo purposes, using user_id=1 (first user)
     current_user_id = 1
     
-    try:
-        # Check if user exists
-        user = User.query.get(current_user_id)
-        if user is None:
-            return jsonify({"error": "User not found"}), 404
-        
-        # Check if planet exists
-        planet = Planet.query.get(planet_id)
-        if planet is None:
-            return jsonify({"error": "Planet not found"}), 404
-        
-        # Check if favorite already exists
-        existing_favorite = FavoritePlanet.query.filter_by(
-            user_id=current_user_id, 
-            planet_id=planet_id
-        ).first()
-        
-        if existing_favorite:
-            return jsonify({"error": "Planet is already in favorites"}), 400
-        
-        # Create new favorite
-        favorite = FavoritePlanet(user_id=current_user_id, planet_id=planet_id)
-        db.session.add(favorite)
-        db.session.commit()
-        
-        return jsonify(favorite.serialize()), 201
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    # Check if user exists
+    user = db.session.get(User, current_user_id)
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    
+    # Check if planet exists
+    planet = db.session.get(Planet, planet_id)
+    if planet is None:
+        return jsonify({"error": "Planet not found"}), 404
+    
+    # Create new favorite, letting the unique constraint catch duplicates
+    favorite = db.session.execute(
+        insert_or_ignore(db.session, FavoritePlanet, ['user_id', 'planet_id'])
+        .values(user_id=current_user_id, planet_id=planet_id)
+        .returning(FavoritePlanet)
+    ).scalar()
+    if favorite is None:
+        return jsonify({"error": "Planet is already in favorites"}), 400
+    
+    return jsonify(favorite.serialize()), 201
 
 @app.route('/favorite/people/<int:people_id>', methods=['POST'])
 def add_favorite_people(people_id):
@@ -373,35 +601,88 @@ def add_favorite_people(people_id):
     # For demo purposes, using user_id=1 (first user)
     current_user_id = 1
     
-    try:
-        # Check if user exists
-        user = User.query.get(current_user_id)
-        if user is None:
-            return jsonify({"error": "User not found"}), 404
-        
-        # Check if character exists
-        character = Character.query.get(people_id)
-        if character is None:
-            return jsonify({"error": "Character not found"}), 404
-        
-        # Check if favorite already exists
-        existing_favorite = FavoriteCharacter.query.filter_by(
-            user_id=current_user_id, 
-            character_id=people_id
-        ).first()
-        
-        if existing_favorite:
-            return jsonify({"error": "Character is already in favorites"}), 400
-        
-        # Create new favorite
-        favorite = FavoriteCharacter(user_id=current_user_id, character_id=people_id)
-        db.session.add(favorite)
-        db.session.commit()
-        
-        return jsonify(favorite.serialize()), 201
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    # Check if user exists
+    user = db.session.get(User, current_user_id)
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    
+    # Check if character exists
+    character = db.session.get(Character, people_id)
+    if character is None:
+        return jsonify({"error": "Character not found"}), 404
+    
+    # Create new favorite, letting the unique constraint catch duplicates
+    favorite = db.session.execute(
+        insert_or_ignore(db.session, FavoriteCharacter, ['user_id', 'character_id'])
+        .values(user_id=current_user_id, character_id=people_id)
+        .returning(FavoriteCharacter)
+    ).scalar()
+    if favorite is None:
+        return jsonify({"error": "Character is already in favorites"}), 400
+    
+    return jsonify(favorite.serialize()), 201
+
+@app.route('/favorite/planet/bulk', methods=['POST'])
+def add_favorite_planet_bulk():
+    """Add a list of planet ids to the current user's favorites"""
+    # For demo purposes, using user_id=1 (first user)
+    current_user_id = 1
+    
+    body = request.get_json()
+    if not isinstance(body, list) or not body:
+        return jsonify({"error": "Request body must be a non-empty list of ids"}), 400
+    
+    # Reject anything but integer ids (bool is an int subclass) before it reaches the IN clause
+    if not all(isinstance(item, int) and not isinstance(item, bool) for item in body):
+        return jsonify({"error": "Every id must be an integer"}), 400
+    
+    # Check if user exists
+    user = db.session.get(User, current_user_id)
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    
+    # Keep only ids that exist, in one query
+    planet_ids = db.session.scalars(select(Planet.id).where(Planet.id.in_(body))).all()
+    if not planet_ids:
+        return jsonify({"error": "Planet not found"}), 404
+    
+    # Favorites that already exist are skipped by the unique constraint
+    ids = db.session.scalars(
+        insert_or_ignore(db.session, FavoritePlanet, ['user_id', 'planet_id']).returning(FavoritePlanet.id),
+        [{"user_id": current_user_id, "planet_id": planet_id} for planet_id in planet_ids]
+    ).all()
+    return jsonify({"created": len(ids), "ids": ids}), 201
+
+@app.route('/favorite/people/bulk', methods=['POST'])
+def add_favorite_people_bulk():
+    """Add a list of character ids to the current user's favorites"""
+    # For demo purposes, using user_id=1 (first user)
+    current_user_id = 1
+    
+    body = request.get_json()
+    if not isinstance(body, list) or not body:
+        return jsonify({"error": "Request body must be a non-empty list of ids"}), 400
+    
+    # Reject anything but integer ids (bool is an int subclass) before it reaches the IN clause
+    if not all(isinstance(item, int) and not isinstance(item, bool) for item in body):
+        return jsonify({"error": "Every id must be an integer"}), 400
+    
+    # Check if user exists
+    user = db.session.get(User, current_user_id)
+    if user is None:
+        return jsonify({"error": "User not found"}), 404
+    
+    # Keep only ids that exist, in one query
+    character_ids = db.session.scalars(select(Character.id).where(Character.id.in_(body))).all()
+    if not character_ids:
+        return jsonify({"error": "Character not found"}), 404
+    
+    # Favorites that already exist are skipped by the unique constraint
+    ids = db.session.scalars(
+        insert_or_ignore(db.session, FavoriteCharacter, ['user_id', 'character_id']).returning(FavoriteCharacter.id),
+        [{"user_id": current_user_id, "character_id": character_id} for character_id in character_ids]
+    ).all()
+    return jsonify({"created": len(ids), "ids": ids}), 201
 
 @app.route('/favorite/planet/<int:planet_id>', methods=['DELETE'])
 def delete_favorite_planet(planet_id):
@@ -409,22 +690,16 @@ def delete_favorite_planet(planet_id):
     # For demo purposes, using user_id=1 (first user)
     current_user_id = 1
     
-    try:
-        favorite = FavoritePlanet.query.filter_by(
-            user_id=current_user_id, 
-            planet_id=planet_id
-        ).first()
-        
-        if favorite is None:
-            return jsonify({"error": "Favorite planet not found"}), 404
-        
-        db.session.delete(favorite)
-        db.session.commit()
-        
-        return jsonify({"message": "Favorite planet deleted successfully"}), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    favorite = db.session.execute(
+        select(FavoritePlanet).filter_by(user_id=current_user_id, planet_id=planet_id)
+    ).scalar_one_or_none()
+    
+    if favorite is None:
+        return jsonify({"error": "Favorite planet not found"}), 404
+    
+    db.session.delete(favorite)
+    
+    return jsonify({"message": "Favorite planet deleted successfully"}), 200
 
 @app.route('/favorite/people/<int:people_id>', methods=['DELETE'])
 def delete_favorite_people(people_id):
@@ -432,22 +707,46 @@ def delete_favorite_people(people_id):
     # For demo purposes, using user_id=1 (first user)
     current_user_id = 1
     
-    try:
-        favorite = FavoriteCharacter.query.filter_by(
-            user_id=current_user_id, 
-            character_id=people_id
-        ).first()
-        
-        if favorite is None:
-            return jsonify({"error": "Favorite character not found"}), 404
-        
-        db.session.delete(favorite)
-        db.session.commit()
-        
-        return jsonify({"message": "Favorite character deleted successfully"}), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    favorite = db.session.execute(
+        select(FavoriteCharacter).filter_by(user_id=current_user_id, character_id=people_id)
+    ).scalar_one_or_none()
+    
+    if favorite is None:
+        return jsonify({"error": "Favorite character not found"}), 404
+    
+    db.session.delete(favorite)
+    
+    return jsonify({"message": "Favorite character deleted successfully"}), 200
+
+# ============================================
+# ADMIN ENDPOINTS
+# ============================================
+
+@app.route('/admin/import', methods=['POST'])
+def import_data():
+    """Seed planets and people from a large dump, e.g. the full SWAPI export"""
+    body = request.get_json()
+    if not isinstance(body, dict):
+        return jsonify({"error": "Request body must be an object with 'planets' and/or 'people' lists"}), 400
+    
+    planets = body.get('planets', [])
+    people = body.get('people', [])
+    if not isinstance(planets, list) or not isinstance(people, list):
+        return jsonify({"error": "'planets' and 'people' must be lists"}), 400
+    
+    # Validate required fields
+    if not all(isinstance(item, dict) and item.get('name') for item in planets + people):
+        return jsonify({"error": "Name is required for every planet and character"}), 400
+    
+    # Planets go first so characters can reference their homeworld
+    imported = {
+        "planets": import_rows(db.session, Planet, PLANET_FIELDS, planets),
+        "people": import_rows(db.session, Character, CHARACTER_FIELDS, people)
+    }
+    after_commit(invalidate_planets_cache)
+    after_commit(invalidate_people_cache)
+    
+    return jsonify(imported), 201
 
 # This only runs if `$ python src/app.py` is executed
 if __name__ == '__main__':
@@ -1,5 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from operator import attrgetter
 
 db = SQLAlchemy()
 
@@ -22,19 +23,23 @@ class User(db.Model):
     favorite_characters = db.relationship('FavoriteCharacter', backref='user', lazy=True, cascade='all, delete-orphan')
     favorite_planets = db.relationship('FavoritePlanet', backref='user', lazy=True, cascade='all, delete-orphan')
     
+    # Columns serialize() exposes, fetched together by one attrgetter call
+    serialize_fields = (
+        'id',
+        'username',
+        'email',
+        'first_name',
+        'last_name',
+        'created_at',
+        'is_active'
+    )
+    _serialize_values = attrgetter(*serialize_fields)
+    
     def __repr__(self):
         return f'<User {self.username}>'
     
     def serialize(self):
-        return {
-            "id": self.id,
-            "username": self.username,
-            "email": self.email,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "is_active": self.is_active
-        }
+        return dict(zip(self.serialize_fields, self._serialize_values(self)))
 
 class Character(db.Model):
     """
@@ -43,7 +48,7 @@ class Character(db.Model):
     __tablename__ = 'characters'
     
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), unique=True, index=True, nullable=False)
     height = db.Column(db.String(10))  # e.g., "172"
     mass = db.Column(db.String(10))    # e.g., "77"
     hair_color = db.Column(db.String(50))
@@ -51,7 +56,7 @@ class Character(db.Model):
     eye_color = db.Column(db.String(50))
     birth_year = db.Column(db.String(20))  # e.g., "19BBY"
     gender = db.Column(db.String(20))
-    homeworld_id = db.Column(db.Integer, db.ForeignKey('planets.id'))
+    homeworld_id = db.Column(db.Integer, db.ForeignKey('planets.id'), index=True)
     description = db.Column(db.Text)
     image_url = db.Column(db.String(255))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -60,25 +65,33 @@ class Character(db.Model):
     homeworld = db.relationship('Planet', backref='native_characters', foreign_keys=[homeworld_id])
     favorite_by_users = db.relationship('FavoriteCharacter', backref='character', lazy=True)
     
+    # Columns serialize() exposes, fetched together by one attrgetter call
+    serialize_fields = (
+        'id',
+        'name',
+        'height',
+        'mass',
+        'hair_color',
+        'skin_color',
+        'eye_color',
+        'birth_year',
+        'gender',
+        'homeworld_id',
+        'description',
+        'image_url',
+        'created_at'
+    )
+    _serialize_values = attrgetter(*serialize_fields)
+    
     def __repr__(self):
         return f'<Character {self.name}>'
     
-    def serialize(self):
-        return {
-            "id": self.id,
-            "name": self.name,
-            "height": self.height,
-            "mass": self.mass,
-            "hair_color": self.hair_color,
-            "skin_color": self.skin_color,
-            "eye_color": self.eye_color,
-            "birth_year": self.birth_year,
-            "gender": self.gender,
-            "homeworld": self.homeworld.serialize() if self.homeworld else None,
-            "description": self.description,
-            "image_url": self.image_url,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
+    def serialize(self, expand=False):
+        data = dict(zip(self.serialize_fields, self._serialize_values(self)))
+        # The nested planet is opt-in; by default clients get just homeworld_id
+        if expand:
+            data["homeworld"] = self.homeworld.serialize() if self.homeworld else None
+        return data
 
 class Planet(db.Model):
     """
@@ -87,7 +100,7 @@ class Planet(db.Model):
     __tablename__ = 'planets'
     
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), unique=True, index=True, nullable=False)
     rotation_period = db.Column(db.String(20))  # hours
     orbital_period = db.Column(db.String(20))   # days
     diameter = db.Column(db.String(20))         # km
@@ -103,25 +116,29 @@ class Planet(db.Model):
     # Relationships
     favorite_by_users = db.relationship('FavoritePlanet', backref='planet', lazy=True)
     
+    # Columns serialize() exposes, fetched together by one attrgetter call
+    serialize_fields = (
+        'id',
+        'name',
+        'rotation_period',
+        'orbital_period',
+        'diameter',
+        'climate',
+        'gravity',
+        'terrain',
+        'surface_water',
+        'population',
+        'description',
+        'image_url',
+        'created_at'
+    )
+    _serialize_values = attrgetter(*serialize_fields)
+    
     def __repr__(self):
         return f'<Planet {self.name}>'
     
     def serialize(self):
-        return {
-            "id": self.id,
-            "name": self.name,
-            "rotation_period": self.rotation_period,
-            "orbital_period": self.orbital_period,
-            "diameter": self.diameter,
-            "climate": self.climate,
-            "gravity": self.gravity,
-            "terrain": self.terrain,
-            "surface_water": self.surface_water,
-            "population": self.population,
-            "description": self.description,
-            "image_url": self.image_url,
-            "created_at": self.created_at.isoformat() if self.created_at else None
-        }
+        return dict(zip(self.serialize_fields, self._serialize_values(self)))
 
 class FavoriteCharacter(db.Model):
     """
@@ -131,10 +148,11 @@ class FavoriteCharacter(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    character_id = db.Column(db.Integer, db.ForeignKey('characters.id'), nullable=False)
+    character_id = db.Column(db.Integer, db.ForeignKey('characters.id'), index=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
-    # Unique constraint to prevent duplicate favorites
+    # Unique constraint to prevent duplicate favorites; its (user_id, character_id) index
+    # also serves the per-user lookups, while character_id's own index covers reverse lookups
     __table_args__ = (db.UniqueConstraint('user_id', 'character_id', name='unique_user_character'),)
     
     def __repr__(self):
@@ -146,7 +164,7 @@ class FavoriteCharacter(db.Model):
             "user_id": self.user_id,
             "character_id": self.character_id,
             "character": self.character.serialize() if self.character else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
 
 class FavoritePlanet(db.Model):
@@ -157,10 +175,11 @@ class FavoritePlanet(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    planet_id = db.Column(db.Integer, db.ForeignKey('planets.id'), nullable=False)
+    planet_id = db.Column(db.Integer, db.ForeignKey('planets.id'), index=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
-    # Unique constraint to prevent duplicate favorites
+    # Unique constraint to prevent duplicate favorites; its (user_id, planet_id) index
+    # also serves the per-user lookups, while planet_id's own index covers reverse lookups
     __table_args__ = (db.UniqueConstraint('user_id', 'planet_id', name='unique_user_planet'),)
     
     def __repr__(self):
@@ -172,5 +191,5 @@ class FavoritePlanet(db.Model):
             "user_id": self.user_id,
             "planet_id": self.planet_id,
             "planet": self.planet.serialize() if self.planet else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
\ No newline at end of file
@@ -1,4 +1,11 @@
+import io
+from datetime import datetime
+import orjson
 from flask import jsonify, url_for
+from flask.json.provider import JSONProvider
+from psycopg2.extensions import get_wait_callback
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 class APIException(Exception):
     status_code = 400
@@ -15,6 +22,84 @@ class APIException(Exception):
         rv['message'] = self.message
         return rv
 
+class ORJSONProvider(JSONProvider):
+    # orjson encodes datetimes natively, so models hand created_at over as-is
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def insert_or_ignore(session, model, index_elements):
+    # INSERT ... ON CONFLICT DO NOTHING, so the unique index decides in a single round-trip
+    if session.get_bind().dialect.name == 'postgresql':
+        stmt = pg_insert(model)
+    else:
+        stmt = sqlite_insert(model)
+    return stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+# Above this many rows an import is streamed with COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+def csv_field(value):
+    # Quote every value and write NULL as a bare \N, so a real "\N" string is never read as NULL
+    if value is None:
+        return '\\N'
+    return '"' + str(value).replace('"', '""') + '"'
+
+def copy_rows(session, model, columns, rows):
+    # COPY checks permissions and types once for the whole stream. It has no ON CONFLICT,
+    # so rows land in a temp table first and move over with INSERT ... SELECT, which
+    # skips duplicate names the same way the INSERT path does.
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(','.join(csv_field(row[column]) for column in columns) + '\n')
+    buffer.seek(0)
+
+    table = model.__tablename__
+    staging = f"import_{table}"
+    column_list = ', '.join(columns)
+    raw = session.connection().connection
+    with raw.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA"
+        )
+        cursor.copy_expert(
+            f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer
+        )
+        cursor.execute(
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} "
+            "ON CONFLICT (name) DO NOTHING"
+        )
+        return cursor.rowcount
+
+def import_rows(session, model, fields, items):
+    rows = [{field: item.get(field) for field in fields} for item in items]
+    if not rows:
+        return 0
+
+    # psycopg2 refuses COPY while a wait callback is registered, which the gevent
+    # workers do through psycogreen; there the multi-row INSERT below is used instead
+    use_copy = (
+        len(rows) > COPY_THRESHOLD
+        and session.get_bind().dialect.name == 'postgresql'
+        and get_wait_callback() is None
+    )
+    if use_copy:
+        # COPY skips the Python-side column defaults, so fill created_at here
+        now = datetime.utcnow()
+        for row in rows:
+            row['created_at'] = now
+        return copy_rows(session, model, list(fields) + ['created_at'], rows)
+
+    ids = session.scalars(
+        insert_or_ignore(session, model, ['name']).returning(model.id),
+        rows,
+        execution_options={"render_nulls": True}
+    ).all()
+    return len(ids)
+
 def has_no_empty_params(rule):
     defaults = rule.defaults if rule.defaults is not None else ()
     arguments = rule.arguments if rule.arguments is not None else ()
@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Point the app at a throwaway SQLite file before it is imported
+DB_FILE = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_FILE}"
+os.environ.pop("REDIS_URL", None)
+os.environ.pop("GEVENT_PATCH", None)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import app as flask_app  # noqa: E402
+from models import db, User, Planet, Character  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    flask_app.config["TESTING"] = True
+    with flask_app.app_context():
+        db.create_all()
+        tatooine = Planet(name="Tatooine", climate="arid")
+        db.session.add_all([
+            User(username="luke", email="luke@example.com", password_hash="x",
+                 first_name="Luke", last_name="Skywalker"),
+            tatooine,
+            Planet(name="Hoth", climate="frozen"),
+            Character(name="Luke Skywalker", homeworld=tatooine),
+            Character(name="Yoda"),
+        ])
+        db.session.commit()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
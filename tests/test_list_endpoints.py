@@ -0,0 +1,46 @@
+"""
+The list endpoints query with raiseload('*'), so any relationship a serializer
+touches without an eager load raises InvalidRequestError. The app's error
+handler would turn that into a 500, so every request here must come back 200.
+"""
+
+
+def test_list_users(client):
+    response = client.get("/users")
+    assert response.status_code == 200
+    users = response.get_json()
+    assert [user["username"] for user in users] == ["luke"]
+    assert "password_hash" not in users[0]
+
+
+def test_list_planets(client):
+    response = client.get("/planets")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [planet["name"] for planet in body["data"]] == ["Tatooine", "Hoth"]
+    assert body["next"] is None
+
+
+def test_list_people(client):
+    response = client.get("/people")
+    assert response.status_code == 200
+    people = response.get_json()["data"]
+    assert [person["name"] for person in people] == ["Luke Skywalker", "Yoda"]
+    assert all("homeworld" not in person for person in people)
+
+
+def test_list_people_expand_homeworld(client):
+    response = client.get("/people?expand=homeworld")
+    assert response.status_code == 200
+    luke, yoda = response.get_json()["data"]
+    assert luke["homeworld"]["name"] == "Tatooine"
+    assert yoda["homeworld"] is None
+
+
+def test_list_people_paginates(client):
+    response = client.get("/people?limit=1")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert len(body["data"]) == 1
+    response = client.get(f"/people?limit=1&after={body['next']}")
+    assert [person["name"] for person in response.get_json()["data"]] == ["Yoda"]
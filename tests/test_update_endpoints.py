@@ -0,0 +1,36 @@
+"""
+Renames go through the unique index on name, so taking another record's
+name must be refused the same way a duplicate create is. Once an update is
+committed, a failing cache invalidation must not turn it into an error.
+"""
+
+
+def test_rename_person_to_existing_name(client):
+    response = client.put("/people/2", json={"name": "Luke Skywalker"})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Character with this name already exists"}
+    assert client.get("/people/2").get_json()["name"] == "Yoda"
+
+
+def test_rename_planet_to_existing_name(client):
+    response = client.put("/planets/2", json={"name": "Tatooine"})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Planet with this name already exists"}
+
+
+def test_update_keeping_own_name(client):
+    response = client.put("/planets/1", json={"name": "Tatooine", "climate": "hot"})
+    assert response.status_code == 200
+    assert response.get_json()["climate"] == "hot"
+
+
+def test_committed_write_survives_cache_failure(client, monkeypatch):
+    from app import cache
+
+    def unreachable(*args, **kwargs):
+        raise ConnectionError("redis down")
+    monkeypatch.setattr(cache.cache, "inc", unreachable)
+
+    response = client.put("/planets/2", json={"climate": "icy"})
+    assert response.status_code == 200
+    assert client.get("/planets/2").get_json()["climate"] == "icy"